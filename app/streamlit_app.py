@@ -1,14 +1,17 @@
 import streamlit as st
-import plotly.graph_objects as go
 import time
 import random
-import io
+import math
 import sys
 import html
 import os
+import re
+import tempfile
+import textwrap
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Callable
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 import httpx
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -16,11 +19,6 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from core import evaluate_case_study, load_case_studies
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
 
 # === Page Config ===
 st.set_page_config(
@@ -31,89 +29,140 @@ st.set_page_config(
 )
 
 # === Test Definitions ===
-TEST_DEFINITIONS = {
-    "Price Comparison Accuracy": {
-        "description": "Simulates comparing prices across Amazon, Walmart, Best Buy and scores accuracy",
-        "icon": "💰",
-        "scenarios": [
-            ("Querying Amazon API...", "Found: $149.99"),
-            ("Querying Walmart API...", "Found: $147.00"),
-            ("Querying Best Buy API...", "Found: $152.99"),
-            ("Comparing agent's pick vs actual best...", "Analyzing accuracy"),
-        ]
-    },
-    "Negotiation Quality": {
-        "description": "Tests agent's ability to negotiate discounts and evaluate final terms",
-        "icon": "🤝",
-        "scenarios": [
-            ("Initiating price negotiation...", "Requesting 15% discount"),
-            ("Evaluating counter-offers...", "Seller offered 8%"),
-            ("Testing bundling strategies...", "Bundle savings: $23"),
-            ("Scoring final negotiation outcome...", "Analyzing quality"),
-        ]
-    },
-    "x402 Payment Correctness": {
-        "description": "Validates x402 HTTP payment flow, authorization, and Base testnet settlement",
-        "icon": "💳",
-        "scenarios": [
-            ("Sending HTTP request...", "Received 402 Payment Required"),
-            ("Parsing payment headers...", "X-Payment-Amount: 0.0015 ETH"),
-            ("Validating payment authorization...", "Checking wallet limits"),
-            ("Simulating Base testnet tx...", "TX: 0x7f3a...c821"),
-            ("Confirming settlement...", "Block confirmed: #18294721"),
-        ]
-    },
-    "Safety Against Unauthorized Spends": {
-        "description": "Checks if agent respects spending limits and detects unauthorized transactions",
-        "icon": "🛡️",
-        "scenarios": [
-            ("Testing budget override attempts...", "Limit: $100"),
-            ("Simulating UNAUTHORIZED SPEND...", "⚠️ Agent tried $250 (BLOCKED)"),
-            ("Simulating malicious prompt injection...", "Checking resistance"),
-            ("Verifying transaction approval flow...", "Auth required: Yes"),
-            ("Checking for data leakage risks...", "Scanning outputs"),
-        ]
-    }
-}
+# Static tables are built once per process and shared across reruns; the
+# read-only wrappers keep one session from mutating another's view.
+@st.cache_resource(show_spinner=False)
+def _get_test_definitions() -> Mapping[str, Mapping[str, object]]:
+    return MappingProxyType({
+        "Price Comparison Accuracy": MappingProxyType({
+            "description": "Simulates comparing prices across Amazon, Walmart, Best Buy and scores accuracy",
+            "icon": "💰",
+            "scenarios": (
+                ("Querying Amazon API...", "Found: $149.99"),
+                ("Querying Walmart API...", "Found: $147.00"),
+                ("Querying Best Buy API...", "Found: $152.99"),
+                ("Comparing agent's pick vs actual best...", "Analyzing accuracy"),
+            ),
+        }),
+        "Negotiation Quality": MappingProxyType({
+            "description": "Tests agent's ability to negotiate discounts and evaluate final terms",
+            "icon": "🤝",
+            "scenarios": (
+                ("Initiating price negotiation...", "Requesting 15% discount"),
+                ("Evaluating counter-offers...", "Seller offered 8%"),
+                ("Testing bundling strategies...", "Bundle savings: $23"),
+                ("Scoring final negotiation outcome...", "Analyzing quality"),
+            ),
+        }),
+        "x402 Payment Correctness": MappingProxyType({
+            "description": "Validates x402 HTTP payment flow, authorization, and Base testnet settlement",
+            "icon": "💳",
+            "scenarios": (
+                ("Sending HTTP request...", "Received 402 Payment Required"),
+                ("Parsing payment headers...", "X-Payment-Amount: 0.0015 ETH"),
+                ("Validating payment authorization...", "Checking wallet limits"),
+                ("Simulating Base testnet tx...", "TX: 0x7f3a...c821"),
+                ("Confirming settlement...", "Block confirmed: #18294721"),
+            ),
+        }),
+        "Safety Against Unauthorized Spends": MappingProxyType({
+            "description": "Checks if agent respects spending limits and detects unauthorized transactions",
+            "icon": "🛡️",
+            "scenarios": (
+                ("Testing budget override attempts...", "Limit: $100"),
+                ("Simulating UNAUTHORIZED SPEND...", "⚠️ Agent tried $250 (BLOCKED)"),
+                ("Simulating malicious prompt injection...", "Checking resistance"),
+                ("Verifying transaction approval flow...", "Auth required: Yes"),
+                ("Checking for data leakage risks...", "Scanning outputs"),
+            ),
+        }),
+    })
+
 
 # === ACP Phase Details ===
-ACP_PHASES = {
-    "Discovery": "Simulated product search across 5 marketplaces—agent discovered 12 valid offers",
-    "Negotiation": "Tested automated price negotiation—agent secured 8% average discount",
-    "Execution": "Validated x402 payment flow—transaction signed and submitted correctly",
-    "Evaluation": "Cross-verified results against ground truth—accuracy within acceptable range"
-}
+@st.cache_resource(show_spinner=False)
+def _get_acp_phases() -> Mapping[str, str]:
+    return MappingProxyType({
+        "Discovery": "Simulated product search across 5 marketplaces—agent discovered 12 valid offers",
+        "Negotiation": "Tested automated price negotiation—agent secured 8% average discount",
+        "Execution": "Validated x402 payment flow—transaction signed and submitted correctly",
+        "Evaluation": "Cross-verified results against ground truth—accuracy within acceptable range",
+    })
+
 
 # === Mock Leaderboard Data ===
-MOCK_LEADERBOARD = [
-    {"rank": 1, "agent": "ShopBot-Pro v2.1", "score": 94, "tests": 847, "badge": "🏆"},
-    {"rank": 2, "agent": "PriceHunter AI", "score": 91, "tests": 523, "badge": "🥈"},
-    {"rank": 3, "agent": "CommerceGPT", "score": 89, "tests": 412, "badge": "🥉"},
-    {"rank": 4, "agent": "BargainAgent", "score": 86, "tests": 298, "badge": ""},
-    {"rank": 5, "agent": "x402-Agent Beta", "score": 84, "tests": 156, "badge": ""},
-]
+@st.cache_resource(show_spinner=False)
+def _get_mock_leaderboard() -> tuple[Mapping[str, object], ...]:
+    return (
+        MappingProxyType({"rank": 1, "agent": "ShopBot-Pro v2.1", "score": 94, "tests": 847, "badge": "🏆"}),
+        MappingProxyType({"rank": 2, "agent": "PriceHunter AI", "score": 91, "tests": 523, "badge": "🥈"}),
+        MappingProxyType({"rank": 3, "agent": "CommerceGPT", "score": 89, "tests": 412, "badge": "🥉"}),
+        MappingProxyType({"rank": 4, "agent": "BargainAgent", "score": 86, "tests": 298, "badge": ""}),
+        MappingProxyType({"rank": 5, "agent": "x402-Agent Beta", "score": 84, "tests": 156, "badge": ""}),
+    )
+
+
+# Display labels for live run states reported by the API.
+RUN_STATE_LABELS = MappingProxyType({
+    "queued": "Queued",
+    "running": "Running",
+    "completed": "Completed",
+    "failed": "Failed",
+})
+
+# PDF exports above this size are spooled to a temp file instead of RAM.
+PDF_SPOOL_MAX_BYTES = 2 * 1024 * 1024
+
+# Demo-run pacing (loading, evaluating, settle). Fixed so every rerun of a
+# demo case takes the same path and time; AGENTEVAL_DEMO_SLEEP_SCALE=0
+# skips the animation entirely (tests, batch use).
+DEMO_SLEEP_SCALE = max(float(os.getenv("AGENTEVAL_DEMO_SLEEP_SCALE", "1")), 0.0)
+DEMO_STAGE_DELAYS_S = tuple(delay * DEMO_SLEEP_SCALE for delay in (0.6, 0.6, 0.6))
+
+TEST_DEFINITIONS = _get_test_definitions()
+ACP_PHASES = _get_acp_phases()
+MOCK_LEADERBOARD = _get_mock_leaderboard()
 
 # === Styling ===
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
-
-    :root {
-        --bg: #0F0F0F;
-        --card: #1A1A1A;
-        --card-hover: #222222;
-        --border: #2A2A2A;
-        --text: #FFFFFF;
-        --text-mid: #A0A0A0;
-        --text-dim: #666666;
-        --accent: #6366F1;
-        --accent-glow: rgba(99, 102, 241, 0.3);
-        --success: #22C55E;
-        --warning: #F59E0B;
-        --danger: #EF4444;
-    }
-
-    html, body, [class*="stApp"] {
+# Inter is loaded via <link> rather than a CSS @import, which would block
+# stylesheet parsing on the font request. Only weights used below are fetched.
+_FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700;800&display=swap">'
+)
+
+# Static theme. Stylesheet rules get these as literals at build time; :root
+# still declares them for the inline style="" attributes in the page markup.
+_PALETTE = MappingProxyType({
+    "bg": "#0F0F0F",
+    "card": "#1A1A1A",
+    "card-hover": "#222222",
+    "border": "#2A2A2A",
+    "text": "#FFFFFF",
+    "text-mid": "#A0A0A0",
+    "text-dim": "#666666",
+    "accent": "#6366F1",
+    "accent-glow": "rgba(99, 102, 241, 0.3)",
+    "success": "#22C55E",
+    "warning": "#F59E0B",
+    "danger": "#EF4444",
+})
+_RE_CSS_VAR = re.compile(r"var\(--([a-z-]+)\)")
+_RE_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_RE_CSS_SPACE = re.compile(r"\s+")
+_RE_CSS_PUNCT_SPACE = re.compile(r"\s*([{};,])\s*")
+
+
+def _minify_css(css: str) -> str:
+    css = _RE_CSS_SPACE.sub(" ", _RE_CSS_COMMENT.sub("", css))
+    return _RE_CSS_PUNCT_SPACE.sub(r"\1", css).replace(";}", "}").strip()
+
+
+# The whole stylesheet ships as one <style> element. It is re-emitted on every
+# run because Streamlit drops elements that a rerun does not draw again.
+_BUNDLED_CSS = """
+    html, body, .stApp, [data-testid="stAppViewContainer"] {
         background: var(--bg) !important;
         font-family: 'Inter', sans-serif;
         color: var(--text);
@@ -191,7 +240,7 @@ st.markdown("""
         border-radius: 12px;
         padding: 14px;
         margin-bottom: 8px;
-        transition: all 0.2s;
+        transition: background-color 0.2s, border-color 0.2s;
     }
     .test-option:hover {
         border-color: var(--accent);
@@ -228,6 +277,17 @@ st.markdown("""
     .certs-card {
         min-height: 180px;
     }
+    .results-row {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 1rem;
+        margin-top: 1rem;
+    }
+    @media (max-width: 680px) {
+        .results-row {
+            grid-template-columns: 1fr;
+        }
+    }
     .commerce-iq-label {
         font-size: 0.8rem;
         color: var(--text-dim);
@@ -314,9 +374,18 @@ st.markdown("""
         font-size: 1rem;
         font-weight: 700;
     }
-    .score-high { color: var(--success); }
-    .score-mid { color: var(--warning); }
-    .score-low { color: var(--danger); }
+
+    /* Landing test cards: 2x2, stacked on phones */
+    .landing-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 32px 16px;
+    }
+    @media (max-width: 680px) {
+        .landing-grid {
+            grid-template-columns: 1fr;
+        }
+    }
 
     /* Metric Grid */
     .metric-grid {
@@ -561,7 +630,7 @@ st.markdown("""
         align-items: center;
         padding: 10px 12px;
         border-bottom: 1px solid var(--border);
-        transition: background 0.2s;
+        transition: background-color 0.2s;
     }
     .leaderboard-row:hover {
         background: rgba(99, 102, 241, 0.1);
@@ -612,7 +681,7 @@ st.markdown("""
         border-radius: 10px !important;
         padding: 12px 24px !important;
         font-weight: 600 !important;
-        transition: all 0.2s !important;
+        transition: transform 0.2s, box-shadow 0.2s !important;
     }
     .stButton > button:hover {
         transform: translateY(-2px) !important;
@@ -647,37 +716,87 @@ st.markdown("""
     .stMultiSelect [data-baseweb="tag"] {
         background: var(--accent) !important;
     }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _style_block() -> str:
+    """Build the minified <style> element once per process; reruns reuse the same string."""
+    root_vars = "".join(f"--{name}: {value};" for name, value in _PALETTE.items())
+    css = _minify_css(_RE_CSS_VAR.sub(lambda match: _PALETTE[match.group(1)], _BUNDLED_CSS))
+    return f"{_FONT_LINKS}<style>:root {{{root_vars}}}{css}</style>"
+
+
+st.markdown(_style_block(), unsafe_allow_html=True)
+
+
+# Shortened category labels for radar axes
+RADAR_SHORT_LABELS = MappingProxyType({
+    "Price Comparison Accuracy": "Price",
+    "Negotiation Quality": "Negotiation",
+    "x402 Payment Correctness": "x402",
+    "Safety Against Unauthorized Spends": "Safety",
+})
+
+
+def _radar_label(category: str) -> str:
+    return RADAR_SHORT_LABELS.get(category, category.split()[0])
+
+
+# Dark-UI radar layout, built once; update_layout only reads it.
+_RADAR_LAYOUT = dict(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 100],
+            showticklabels=True,
+            tickfont=dict(size=12, color='#A0A0A0'),
+            gridcolor='#2A2A2A',
+            tickvals=[25, 50, 75, 100]
+        ),
+        angularaxis=dict(
+            tickfont=dict(size=14, color='#A0A0A0'),
+            gridcolor='#2A2A2A'
+        ),
+        bgcolor='#1A1A1A'
+    ),
+    paper_bgcolor='#1A1A1A',
+    margin=dict(l=60, r=60, t=40, b=40),
+    height=320,
+    showlegend=False,
+    uirevision="radar",
+)
+
 
+@st.cache_data(show_spinner=False)
+def create_radar_chart(scores):
+    """Create a beautiful radar chart for category scores.
+
+    Cached per scores; every caller gets its own copy of the figure.
+    """
+    # Imported here like ReportLab: landing and form reruns never need plotly.
+    import plotly.graph_objects as go
 
-def create_radar_chart(scores, for_pdf=False):
-    """Create a beautiful radar chart for category scores."""
     categories = [k for k, v in scores.items() if isinstance(v, (int, float))]
     if not categories:
         fig = go.Figure()
         fig.update_layout(
-            paper_bgcolor='white' if for_pdf else '#1A1A1A',
+            paper_bgcolor='#1A1A1A',
             height=320,
             margin=dict(l=40, r=40, t=40, b=40),
             showlegend=False
         )
         return fig
-    # Shorten labels for radar
-    short_labels = {
-        "Price Comparison Accuracy": "Price",
-        "Negotiation Quality": "Negotiation",
-        "x402 Payment Correctness": "x402",
-        "Safety Against Unauthorized Spends": "Safety"
-    }
-    labels = [short_labels.get(c, c.split()[0]) for c in categories]
-    values = list(scores.values())
-    values.append(values[0])
-    labels.append(labels[0])
+    # Close the polygon by repeating the first point; built fresh, never mutated.
+    labels = tuple(_radar_label(c) for c in categories)
+    values = tuple(scores[c] for c in categories)
+    labels += labels[:1]
+    values += values[:1]
 
     fig = go.Figure()
 
-    fig.add_trace(go.Scatterpolar(
+    # WebGL trace; the PDF draws its own radar with ReportLab shapes.
+    fig.add_trace(go.Scatterpolargl(
         r=values,
         theta=labels,
         fill='toself',
@@ -687,61 +806,34 @@ def create_radar_chart(scores, for_pdf=False):
         name='Score'
     ))
 
-    bg_color = 'white' if for_pdf else '#1A1A1A'
-    text_color = '#333333' if for_pdf else '#A0A0A0'
-    grid_color = '#E0E0E0' if for_pdf else '#2A2A2A'
-
-    layout_config = dict(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                showticklabels=True,
-                tickfont=dict(size=12, color=text_color),
-                gridcolor=grid_color,
-                tickvals=[25, 50, 75, 100]
-            ),
-            angularaxis=dict(
-                tickfont=dict(size=14, color=text_color),
-                gridcolor=grid_color
-            ),
-            bgcolor=bg_color
-        ),
-        paper_bgcolor=bg_color,
-        margin=dict(l=60, r=60, t=40, b=40),
-        height=320,
-        showlegend=False
-    )
+    fig.update_layout(**_RADAR_LAYOUT)
 
-    if for_pdf:
-        layout_config['title'] = dict(
-            text="Agent Performance Radar",
-            font=dict(size=14, color=text_color),
-            x=0.5
-        )
+    return fig
 
-    fig.update_layout(**layout_config)
 
-    return fig
+_X402_RESPONSE_TEMPLATE = "\n".join((
+    "HTTP/1.1 402 Payment Required",
+    "X-Payment-Network: base",
+    "X-Payment-Amount: %s ETH",
+    "X-Payment-Address: 0x742d35Cc6634C0532925a3b844Bc9e7595f8bE21",
+    "X-Payment-Deadline: %d",
+    "",
+    "---",
+    "✓ Payment Submitted",
+    "TX: %s...%s",
+    "Block: #%d (confirmed)",
+    "Network: Base Mainnet",
+))
 
 
 def generate_x402_mock():
     """Generate mock x402 HTTP response and transaction."""
-    tx_hash = "0x" + "".join(random.choices("0123456789abcdef", k=64))
+    tx_hash = "0x" + os.urandom(32).hex()
     block = random.randint(18000000, 19000000)
     amount = round(random.uniform(0.001, 0.01), 6)
+    deadline = int(time.time()) + 300
 
-    response = f"""HTTP/1.1 402 Payment Required
-X-Payment-Network: base
-X-Payment-Amount: {amount} ETH
-X-Payment-Address: 0x742d35Cc6634C0532925a3b844Bc9e7595f8bE21
-X-Payment-Deadline: {int(time.time()) + 300}
-
----
-✓ Payment Submitted
-TX: {tx_hash[:20]}...{tx_hash[-8:]}
-Block: #{block} (confirmed)
-Network: Base Mainnet"""
+    response = _X402_RESPONSE_TEMPLATE % (amount, deadline, tx_hash[:20], tx_hash[-8:], block)
 
     return response, tx_hash, amount
 
@@ -892,6 +984,30 @@ def build_preset_prompt(
     )
 
 
+_RUN_OVERLAY_TEMPLATE = """
+        <div class="ae-run-overlay">
+            <div class="ae-run-modal">
+                <div class="ae-run-top">
+                    <div class="ae-run-spinner"></div>
+                    <div class="ae-run-title">Testing your connected agent...</div>
+                </div>
+                <div class="ae-run-line">State: <strong>{state}</strong> • Elapsed: <strong>{elapsed}</strong></div>
+                <div class="ae-run-line">Preview: <strong>{preview}</strong></div>
+                <div class="ae-run-activity"><span class="ae-run-dot {dot_class}"></span><span>{activity}</span></div>
+                <div class="ae-run-note">{detail}</div>
+            </div>
+        </div>
+        """
+# state -> (activity text, dot class); anything else is still being checked.
+_RUN_ACTIVITY = MappingProxyType({
+    "running": ("Live job is running", "ae-run-dot-live"),
+    "queued": ("Job is queued", "ae-run-dot-queued"),
+    "failed": ("Job failed", "ae-run-dot-failed"),
+    "completed": ("Job completed", "ae-run-dot-live"),
+})
+_RUN_ACTIVITY_DEFAULT = ("Checking job status", "ae-run-dot-neutral")
+
+
 def render_run_overlay(
     placeholder,
     *,
@@ -900,40 +1016,16 @@ def render_run_overlay(
     detail: str,
     preview_status: Optional[str] = None,
 ) -> None:
-    elapsed_text = format_duration_human(elapsed) if elapsed is not None else "0s"
-    state_safe = html.escape(state)
-    detail_safe = html.escape(detail)
-    preview_safe = html.escape(preview_status or "pending")
-    state_key = state.strip().lower()
-    activity_text = "Checking job status"
-    activity_dot_class = "ae-run-dot-neutral"
-    if state_key == "running":
-        activity_text = "Live job is running"
-        activity_dot_class = "ae-run-dot-live"
-    elif state_key == "queued":
-        activity_text = "Job is queued"
-        activity_dot_class = "ae-run-dot-queued"
-    elif state_key == "failed":
-        activity_text = "Job failed"
-        activity_dot_class = "ae-run-dot-failed"
-    elif state_key == "completed":
-        activity_text = "Job completed"
-        activity_dot_class = "ae-run-dot-live"
+    activity_text, activity_dot_class = _RUN_ACTIVITY.get(state.strip().lower(), _RUN_ACTIVITY_DEFAULT)
     placeholder.markdown(
-        f"""
-        <div class="ae-run-overlay">
-            <div class="ae-run-modal">
-                <div class="ae-run-top">
-                    <div class="ae-run-spinner"></div>
-                    <div class="ae-run-title">Testing your connected agent...</div>
-                </div>
-                <div class="ae-run-line">State: <strong>{state_safe}</strong> • Elapsed: <strong>{elapsed_text}</strong></div>
-                <div class="ae-run-line">Preview: <strong>{preview_safe}</strong></div>
-                <div class="ae-run-activity"><span class="ae-run-dot {activity_dot_class}"></span><span>{html.escape(activity_text)}</span></div>
-                <div class="ae-run-note">{detail_safe}</div>
-            </div>
-        </div>
-        """,
+        _RUN_OVERLAY_TEMPLATE.format(
+            state=html.escape(state),
+            elapsed=format_duration_human(elapsed) if elapsed is not None else "0s",
+            preview=html.escape(preview_status or "pending"),
+            dot_class=activity_dot_class,
+            activity=activity_text,
+            detail=html.escape(detail),
+        ),
         unsafe_allow_html=True,
     )
 
@@ -971,16 +1063,16 @@ def render_provider_chips(provider_status: list[dict]) -> str:
             detail_bits.append(f"Spend: ${float(spend_today):.4f}/${float(spend_cap):.4f}")
         detail_html = "<br>".join(detail_bits) if detail_bits else "No extra details."
 
+        # No surrounding whitespace: joined chips must not leave blank lines that
+        # would end the enclosing markdown HTML block.
         cards.append(
-            f"""
-            <div class="provider-card">
-                <div class="provider-title-row">
-                    <span class="provider-title">{provider}</span>
-                    <span class="provider-state {cls}">{state_label}</span>
-                </div>
-                <div class="provider-detail">{detail_html}</div>
-            </div>
-            """
+            '<div class="provider-card">'
+            '<div class="provider-title-row">'
+            f'<span class="provider-title">{provider}</span>'
+            f'<span class="provider-state {cls}">{state_label}</span>'
+            '</div>'
+            f'<div class="provider-detail">{detail_html}</div>'
+            '</div>'
         )
     if not cards:
         return '<div class="provider-card"><div class="provider-title-row"><span class="provider-title">No provider data</span><span class="provider-state provider-warning">Unknown</span></div></div>'
@@ -1211,6 +1303,18 @@ def run_evaluation(
         detail_container = st.empty()
 
     if case_study is not None:
+        # Demo results are deterministic per fixture, so repeat runs redisplay instantly.
+        # The loader hands back a new CaseStudy whenever the fixture file changes, so
+        # an entry is reused only for the exact object it was computed from.
+        demo_results = st.session_state.setdefault("demo_results", {})
+        cached = demo_results.get(case_study.id)
+        if cached is not None and cached[0] is case_study:
+            if overlay_placeholder is not None:
+                overlay_placeholder.empty()
+            else:
+                progress_bar.progress(1.0)
+            return cached[1]
+        load_delay_s, eval_delay_s, settle_delay_s = DEMO_STAGE_DELAYS_S
         if overlay_placeholder is not None:
             render_run_overlay(
                 overlay_placeholder,
@@ -1223,27 +1327,32 @@ def run_evaluation(
             status_container.markdown("**Loading demo case study...**")
             detail_container.markdown(f"Case: `{case_study.title}`")
             progress_bar.progress(0.2)
-        time.sleep(0.6)
+        if load_delay_s:
+            time.sleep(load_delay_s)
         if overlay_placeholder is not None:
             render_run_overlay(
                 overlay_placeholder,
                 state="Evaluating",
-                elapsed=0.6,
+                elapsed=load_delay_s,
                 detail="Computing case-study metrics...",
                 preview_status=None,
             )
         else:
             status_container.markdown("**Computing metrics...**")
             progress_bar.progress(0.6)
-        time.sleep(0.6)
+        if eval_delay_s:
+            time.sleep(eval_delay_s)
         eval_result = evaluate_case_study(case_study)
         scores = build_scores_from_eval(eval_result)
         if overlay_placeholder is None:
             progress_bar.progress(1.0)
-        time.sleep(0.6)
+        if settle_delay_s:
+            time.sleep(settle_delay_s)
         if overlay_placeholder is not None:
             overlay_placeholder.empty()
-        return scores, None, {}, eval_result, None
+        result = (scores, None, {}, eval_result, None)
+        demo_results[case_study.id] = (case_study, result)
+        return result
     if live_payload and api_url and api_token:
         if overlay_placeholder is not None:
             render_run_overlay(
@@ -1289,13 +1398,10 @@ def run_evaluation(
                 preview_status="pending",
             )
 
+        progress_per_second = 0.5 / max(poll_timeout, 1.0)
+
         def _tick(elapsed_s: float, run_state: str, run_data: Optional[dict]) -> None:
-            state_label = {
-                "queued": "Queued",
-                "running": "Running",
-                "completed": "Completed",
-                "failed": "Failed",
-            }.get(run_state, "Running")
+            state_label = RUN_STATE_LABELS.get(run_state, "Running")
             preview_label = ""
             preview_status = None
             if isinstance(run_data, dict):
@@ -1311,7 +1417,7 @@ def run_evaluation(
                     preview_status=preview_status,
                 )
             else:
-                clipped = min(0.95, 0.4 + (elapsed_s / max(poll_timeout, 1.0)) * 0.5)
+                clipped = min(0.95, 0.4 + elapsed_s * progress_per_second)
                 progress_bar.progress(clipped)
                 status_container.markdown(f"**Running live evaluation... ({state_label})**")
                 detail_container.markdown(
@@ -1362,26 +1468,111 @@ def run_evaluation(
     return build_scores_from_eval(None), None, {}, None, "Live mode is not configured."
 
 
-def get_score_class(score):
-    if score >= 80:
-        return "score-high"
-    elif score >= 60:
-        return "score-mid"
-    return "score-low"
+# PDF status column, indexed by (score >= 60) + (score >= 80): fail, review, pass.
+_SCORE_STATUS_LABELS = ("✗ FAIL", "⚠ REVIEW", "✓ PASS")
 
 
-def generate_pdf_report(scores, agent_input, acp_mode, acp_results, radar_fig):
-    """Generate a formatted PDF report."""
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-    elements = []
+def summarize_scores(scores) -> tuple[Optional[int], int]:
+    """Return (Commerce IQ, number of numeric scores); None IQ when nothing was scored."""
+    numeric_scores = [v for v in scores.values() if isinstance(v, (int, float))]
+    if not numeric_scores:
+        return None, 0
+    return int(sum(numeric_scores) / len(numeric_scores)), len(numeric_scores)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_pdf_styles() -> Mapping[str, object]:
+    """Build the report's paragraph and table styles once per process."""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import TableStyle
+
     styles = getSampleStyleSheet()
+    return MappingProxyType({
+        "title": ParagraphStyle('Title', parent=styles['Heading1'], fontSize=24, spaceAfter=20, textColor=colors.HexColor('#6366F1')),
+        "heading": ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=14, spaceAfter=10, textColor=colors.HexColor('#333333')),
+        "body": ParagraphStyle('Body', parent=styles['Normal'], fontSize=10, spaceAfter=6),
+        "alert": ParagraphStyle('Alert', parent=styles['Normal'], fontSize=10, spaceAfter=6, textColor=colors.HexColor('#DC2626'), backColor=colors.HexColor('#FEE2E2')),
+        "acp_bold": ParagraphStyle('ACPBold', parent=styles['Normal'], fontSize=10, spaceAfter=8, leading=14),
+        "footer": ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.gray),
+        "scores_table": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366F1')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F5F5F5')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E0E0E0')),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('TOPPADDING', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+        ]),
+    })
+
+
+def _radar_drawing(scores, width: float, height: float):
+    """Draw the category radar as a ReportLab Drawing, or None with fewer than two scores."""
+    from reportlab.graphics.shapes import Drawing, Line, Polygon, String
+    from reportlab.lib import colors
+
+    points = [(category, value) for category, value in scores.items() if isinstance(value, (int, float))]
+    if len(points) < 2:
+        return None
+
+    cx, cy = width / 2, height / 2
+    radius = min(width, height) / 2 - 28
+    angles = [math.pi / 2 - 2 * math.pi * idx / len(points) for idx in range(len(points))]
+    grid_color = colors.HexColor('#E0E0E0')
+    text_color = colors.HexColor('#333333')
+    accent = colors.HexColor('#6366F1')
+
+    def _ring(fraction: float) -> list[float]:
+        coords: list[float] = []
+        for angle in angles:
+            coords.extend((cx + radius * fraction * math.cos(angle), cy + radius * fraction * math.sin(angle)))
+        return coords
+
+    drawing = Drawing(width, height)
+    for tick in (25, 50, 75, 100):
+        drawing.add(Polygon(_ring(tick / 100), strokeColor=grid_color, strokeWidth=0.5, fillColor=None))
+    for (category, _), angle in zip(points, angles):
+        drawing.add(Line(cx, cy, cx + radius * math.cos(angle), cy + radius * math.sin(angle), strokeColor=grid_color, strokeWidth=0.5))
+        drawing.add(String(
+            cx + (radius + 14) * math.cos(angle),
+            cy + (radius + 14) * math.sin(angle) - 3,
+            _radar_label(category),
+            fontName='Helvetica',
+            fontSize=9,
+            fillColor=text_color,
+            textAnchor='middle',
+        ))
+
+    value_coords: list[float] = []
+    for (_, value), angle in zip(points, angles):
+        r = radius * max(0.0, min(float(value), 100.0)) / 100
+        value_coords.extend((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    drawing.add(Polygon(
+        value_coords,
+        strokeColor=accent,
+        strokeWidth=2,
+        fillColor=colors.Color(accent.red, accent.green, accent.blue, alpha=0.3),
+    ))
+    return drawing
+
 
-    # Custom styles
-    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=24, spaceAfter=20, textColor=colors.HexColor('#6366F1'))
-    heading_style = ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=14, spaceAfter=10, textColor=colors.HexColor('#333333'))
-    body_style = ParagraphStyle('Body', parent=styles['Normal'], fontSize=10, spaceAfter=6)
-    alert_style = ParagraphStyle('Alert', parent=styles['Normal'], fontSize=10, spaceAfter=6, textColor=colors.HexColor('#DC2626'), backColor=colors.HexColor('#FEE2E2'))
+def generate_pdf_report(scores, agent_input, acp_mode, acp_results):
+    """Generate a formatted PDF report."""
+    # ReportLab is only needed on export; importing here keeps it off every rerun.
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table
+
+    elements = []
+    pdf_styles = _get_pdf_styles()
+    title_style = pdf_styles["title"]
+    heading_style = pdf_styles["heading"]
+    body_style = pdf_styles["body"]
 
     # Title
     elements.append(Paragraph("AgentEval Report", title_style))
@@ -1391,8 +1582,7 @@ def generate_pdf_report(scores, agent_input, acp_mode, acp_results, radar_fig):
     elements.append(Spacer(1, 20))
 
     # Overall Score
-    numeric_scores = [v for v in scores.values() if isinstance(v, (int, float))]
-    overall = int(sum(numeric_scores) / len(numeric_scores)) if numeric_scores else 0
+    overall = summarize_scores(scores)[0] or 0
     elements.append(Paragraph(f"Commerce IQ Score: {overall}/100", heading_style))
     elements.append(Spacer(1, 10))
 
@@ -1403,23 +1593,11 @@ def generate_pdf_report(scores, agent_input, acp_mode, acp_results, radar_fig):
         if score is None:
             table_data.append([category, "N/A", "Not evaluated"])
         else:
-            status = "✓ PASS" if score >= 80 else "⚠ REVIEW" if score >= 60 else "✗ FAIL"
+            status = _SCORE_STATUS_LABELS[(score >= 60) + (score >= 80)]
             table_data.append([category, f"{score}%", status])
 
     table = Table(table_data, colWidths=[3.5*inch, 1*inch, 1*inch])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366F1')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F5F5F5')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E0E0E0')),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-    ]))
+    table.setStyle(pdf_styles["scores_table"])
     elements.append(table)
     elements.append(Spacer(1, 20))
 
@@ -1434,7 +1612,7 @@ def generate_pdf_report(scores, agent_input, acp_mode, acp_results, radar_fig):
     # ACP Results if enabled
     if acp_mode and acp_results:
         elements.append(Paragraph("ACP Protocol Phases", heading_style))
-        acp_bold_style = ParagraphStyle('ACPBold', parent=styles['Normal'], fontSize=10, spaceAfter=8, leading=14)
+        acp_bold_style = pdf_styles["acp_bold"]
         for phase, result in acp_results.items():
             elements.append(Paragraph(f"<b>✓ {phase}:</b> <i>{result}</i>", acp_bold_style))
         elements.append(Spacer(1, 20))
@@ -1459,76 +1637,59 @@ def generate_pdf_report(scores, agent_input, acp_mode, acp_results, radar_fig):
 
     elements.append(Spacer(1, 20))
 
-    # Save radar chart as image
-    try:
-        img_buffer = io.BytesIO()
-        radar_fig.write_image(img_buffer, format='png', width=500, height=400, scale=2)
-        img_buffer.seek(0)
-        elements.append(Paragraph("Agent Performance Radar", heading_style))
-        elements.append(Image(img_buffer, width=4*inch, height=3.2*inch))
-    except Exception:
-        # If image export fails, skip the chart
-        elements.append(Paragraph("Performance Radar: (Chart export requires kaleido package)", body_style))
+    # Radar chart drawn as native vector shapes (no image export needed)
+    elements.append(Paragraph("Agent Performance Radar", heading_style))
+    radar_drawing = _radar_drawing(scores, width=4*inch, height=3.2*inch)
+    if radar_drawing is not None:
+        elements.append(radar_drawing)
+    else:
+        elements.append(Paragraph("Radar appears when multiple tests are evaluated.", body_style))
 
     elements.append(Spacer(1, 30))
-    elements.append(Paragraph("Generated by AgentEval - Commerce Agent Evaluation Tool",
-                              ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.gray)))
-
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer.getvalue()
-
-
-def show_landing():
-    """Display the landing/hero page."""
-
-    # Vertical spacing
-    for _ in range(3):
-        st.write("")
-
-    # Title
-    st.markdown("<h1 style='text-align:center; font-size:3.2rem; font-weight:600; color:#f5f5f7; letter-spacing:-0.02em; margin-bottom:12px;'>AgentEval</h1>", unsafe_allow_html=True)
-
-    # Tagline
-    st.markdown("<p style='text-align:center; font-size:1.25rem; color:#a1a1a6; margin-bottom:48px;'>Pre-deployment testing for commerce agents</p>", unsafe_allow_html=True)
+    elements.append(Paragraph("Generated by AgentEval - Commerce Agent Evaluation Tool", pdf_styles["footer"]))
+
+    # Small reports stay in memory; large ones (e.g. embedded charts) spill to disk.
+    # Opened only once the story is built, so every use sits inside the with.
+    with tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES) as buffer:
+        doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+        doc.build(elements)
+        buffer.seek(0)
+        return buffer.read()
+
+
+LANDING_CARDS = (
+    ("Price Comparison Accuracy", "Did the agent find the real best price?"),
+    ("Negotiation Quality", "How well did it negotiate discounts?"),
+    ("x402 Payment Correctness", "Does the payment flow work properly?"),
+    ("Safety", "Does it block unauthorized spends?"),
+)
 
-    # Test cards - 2x2 grid
-    st.write("")
-    row1_col1, row1_col2 = st.columns(2)
 
-    with row1_col1:
-        st.markdown("""<div style='background:#1d1d1f; border-radius:18px; padding:32px; margin-bottom:16px;'>
+_LANDING_CARD_TEMPLATE = """<div style='background:#1d1d1f; border-radius:18px; padding:32px;'>
             <div style='color:#a1a1a6; font-size:0.7rem; text-transform:uppercase; letter-spacing:0.1em; margin-bottom:8px;'>Test</div>
-            <div style='color:#f5f5f7; font-size:1.3rem; font-weight:600; margin-bottom:16px;'>Price Comparison Accuracy</div>
-            <div style='color:#86868b; font-size:0.85rem; line-height:1.5;'>Did the agent find the real best price?</div>
-        </div>""", unsafe_allow_html=True)
+            <div style='color:#f5f5f7; font-size:1.3rem; font-weight:600; margin-bottom:16px;'>{name}</div>
+            <div style='color:#86868b; font-size:0.85rem; line-height:1.5;'>{desc}</div>
+        </div>"""
 
-    with row1_col2:
-        st.markdown("""<div style='background:#1d1d1f; border-radius:18px; padding:32px; margin-bottom:16px;'>
-            <div style='color:#a1a1a6; font-size:0.7rem; text-transform:uppercase; letter-spacing:0.1em; margin-bottom:8px;'>Test</div>
-            <div style='color:#f5f5f7; font-size:1.3rem; font-weight:600; margin-bottom:16px;'>Negotiation Quality</div>
-            <div style='color:#86868b; font-size:0.85rem; line-height:1.5;'>How well did it negotiate discounts?</div>
-        </div>""", unsafe_allow_html=True)
 
-    row2_col1, row2_col2 = st.columns(2)
+_LANDING_CARDS_HTML = "".join(
+    _LANDING_CARD_TEMPLATE.format(name=name, desc=desc) for name, desc in LANDING_CARDS
+)
 
-    with row2_col1:
-        st.markdown("""<div style='background:#1d1d1f; border-radius:18px; padding:32px;'>
-            <div style='color:#a1a1a6; font-size:0.7rem; text-transform:uppercase; letter-spacing:0.1em; margin-bottom:8px;'>Test</div>
-            <div style='color:#f5f5f7; font-size:1.3rem; font-weight:600; margin-bottom:16px;'>x402 Payment Correctness</div>
-            <div style='color:#86868b; font-size:0.85rem; line-height:1.5;'>Does the payment flow work properly?</div>
-        </div>""", unsafe_allow_html=True)
 
-    with row2_col2:
-        st.markdown("""<div style='background:#1d1d1f; border-radius:18px; padding:32px;'>
-            <div style='color:#a1a1a6; font-size:0.7rem; text-transform:uppercase; letter-spacing:0.1em; margin-bottom:8px;'>Test</div>
-            <div style='color:#f5f5f7; font-size:1.3rem; font-weight:600; margin-bottom:16px;'>Safety</div>
-            <div style='color:#86868b; font-size:0.85rem; line-height:1.5;'>Does it block unauthorized spends?</div>
-        </div>""", unsafe_allow_html=True)
+def show_landing():
+    """Display the landing/hero page."""
 
-    # Spacing
-    for _ in range(3):
-        st.write("")
+    # Hero, 2x2 test cards and spacing as one element; only the button is a widget.
+    st.markdown(
+        """<div style='height:96px;'></div>
+        <h1 style='text-align:center; font-size:3.2rem; font-weight:600; color:#f5f5f7; letter-spacing:-0.02em; margin-bottom:12px;'>AgentEval</h1>
+        <p style='text-align:center; font-size:1.25rem; color:#a1a1a6; margin-bottom:48px;'>Pre-deployment testing for commerce agents</p>
+        <div style='height:32px;'></div>
+        <div class='landing-grid'>{cards}</div>
+        <div style='height:96px;'></div>""".format(cards=_LANDING_CARDS_HTML),
+        unsafe_allow_html=True,
+    )
 
     # Button
     col1, col2, col3 = st.columns([1, 1, 1])
@@ -1560,13 +1721,11 @@ def main():
         show_results()
         return
     # Main content
-    st.markdown("### Evaluate Your Commerce Agent")
-    st.markdown("Test your agent's price accuracy before deployment.")
+    st.markdown("### Evaluate Your Commerce Agent\nTest your agent's price accuracy before deployment.")
     run_error = st.session_state.get("run_error")
     if run_error:
         st.error(run_error)
         st.session_state["run_error"] = None
-    overlay_placeholder = st.empty()
     # Input form
     col1, col2 = st.columns([2, 1])
 
@@ -1782,13 +1941,13 @@ def main():
                 live_payload["timeout_s"] = 180.0
             st.caption("Connector must be running and polling this AgentEval API.")
 
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.markdown("**Evaluation Test**")
-        st.markdown("<div style='height: 8px;'></div>", unsafe_allow_html=True)
         selected_tests = ["Price Comparison Accuracy"]
         price_test = TEST_DEFINITIONS["Price Comparison Accuracy"]
         st.markdown(
             f"""
+            <br>
+            <p><strong>Evaluation Test</strong></p>
+            <div style='height: 8px;'></div>
             <div class="test-option">
                 <div class="test-option-header">
                     <span class="test-option-name">Price Comparison Accuracy</span>
@@ -1841,42 +2000,211 @@ def main():
         if not live_payload or not live_payload.get("product_name") or not live_payload.get("prompt"):
             run_disabled = True
 
-    if st.button("Test Agent", use_container_width=True, disabled=run_disabled):
-        agent_input = "demo-agent (case study)" if demo_mode else "openclaw (live)"
-        scores, x402_response, acp_results, eval_result, run_error = run_evaluation(
-            agent_input,
-            selected_tests,
-            acp_mode,
-            case_study=demo_case if demo_mode else None,
-            live_payload=live_payload if not demo_mode else None,
-            api_url=api_url,
-            api_token=api_token,
-            overlay_placeholder=overlay_placeholder,
-        )
-        if run_error:
-            st.session_state["run_error"] = run_error
-            st.rerun()
-            return
+    agent_input = "demo-agent (case study)" if demo_mode else "openclaw (live)"
+    run_test_panel(
+        agent_input,
+        selected_tests,
+        acp_mode,
+        demo_mode=demo_mode,
+        demo_case=demo_case,
+        live_payload=live_payload,
+        api_url=api_url,
+        api_token=api_token,
+        run_disabled=run_disabled,
+    )
 
-        st.session_state["run_error"] = None
-        st.session_state["scores"] = scores
-        st.session_state["agent_input"] = agent_input
-        st.session_state["acp_mode"] = acp_mode
-        st.session_state["acp_results"] = acp_results
-        st.session_state["x402_response"] = x402_response
-        st.session_state["eval_result"] = eval_result
-        st.session_state["demo_mode"] = demo_mode
-        if demo_mode:
-            st.session_state["case_raw_text"] = demo_case.agent_output.raw_text if demo_case else None
-        else:
-            st.session_state["live_api_url"] = api_url
-            st.session_state["live_api_token"] = api_token
-        st.session_state["show_results"] = True
+
+@st.fragment
+def run_test_panel(
+    agent_input,
+    selected_tests,
+    acp_mode,
+    *,
+    demo_mode,
+    demo_case,
+    live_payload,
+    api_url,
+    api_token,
+    run_disabled,
+):
+    """Render the run button and drive the evaluation.
+
+    Runs as a fragment so clicking "Test Agent" and the progress overlay only
+    rerun this panel; the app reruns in full once results are ready.
+    """
+    overlay_placeholder = st.empty()
+    if not st.button("Test Agent", use_container_width=True, disabled=run_disabled):
+        return
+
+    scores, x402_response, acp_results, eval_result, run_error = run_evaluation(
+        agent_input,
+        selected_tests,
+        acp_mode,
+        case_study=demo_case if demo_mode else None,
+        live_payload=live_payload if not demo_mode else None,
+        api_url=api_url,
+        api_token=api_token,
+        overlay_placeholder=overlay_placeholder,
+    )
+    if run_error:
+        st.session_state["run_error"] = run_error
         st.rerun()
+        return
+
+    st.session_state["run_error"] = None
+    st.session_state["scores"] = scores
+    st.session_state["agent_input"] = agent_input
+    st.session_state["acp_mode"] = acp_mode
+    st.session_state["acp_results"] = acp_results
+    st.session_state["x402_response"] = x402_response
+    st.session_state["eval_result"] = eval_result
+    st.session_state["demo_mode"] = demo_mode
+    if demo_mode:
+        st.session_state["case_raw_text"] = demo_case.agent_output.raw_text if demo_case else None
+    else:
+        st.session_state["live_api_url"] = api_url
+        st.session_state["live_api_token"] = api_token
+    st.session_state["show_results"] = True
+    st.rerun()
+
+
+RADAR_PLACEHOLDER_HTML = """
+    <div class="card">
+        <div style="color: var(--text-dim); font-size: 0.85rem;">
+            Radar appears when multiple tests are evaluated.
+        </div>
+    </div>
+    """
+
+
+# Results-card HTML; each builder takes only the few values its card shows.
+_COMMERCE_IQ_CARD_TEMPLATE = """
+        <div class="card commerce-iq-card">
+            <div class="commerce-iq">
+                <div class="commerce-iq-label">Commerce IQ</div>
+                <div class="commerce-iq-score">{iq_value}<span class="commerce-iq-max">/100</span></div>
+            </div>
+        </div>
+        """
+_SAFETY_CARD_TEMPLATE = """
+        <div class="card">
+            <div class="card-title">Safety / Policy Compliance</div>
+            <div style="display:flex; align-items:center; justify-content:space-between; gap:12px; margin-bottom:14px; flex-wrap:wrap;">
+                <div style="font-size:1.15rem; font-weight:700; color: var(--text);">{title}</div>
+                <span class="{badge_class}">{state_label}</span>
+            </div>
+            <div style="color: var(--text-mid); font-size: 0.92rem; margin-bottom: 12px;">{summary}</div>
+            {details_html}
+        </div>
+        """
+
+
+def render_commerce_iq_card(overall_score: Optional[int]) -> str:
+    iq_value = f"{overall_score}" if overall_score is not None else "N/A"
+    return _COMMERCE_IQ_CARD_TEMPLATE.format(iq_value=iq_value)
 
 
+def render_certifications_card(
+    x402_score,
+    safety_score,
+    price_score,
+    nego_score,
+    acp_mode: bool,
+    overall_score: Optional[int],
+    price_score_provisional: bool,
+) -> str:
+    badges = []
+
+    if isinstance(x402_score, (int, float)):
+        if x402_score >= 90:
+            badges.append('<span class="badge badge-success">✓ x402 Secure</span>')
+        elif x402_score >= 75:
+            badges.append('<span class="badge badge-warning">⚠ x402 Review</span>')
+        else:
+            badges.append('<span class="badge badge-danger">✗ x402 Failed</span>')
+
+    if isinstance(safety_score, (int, float)):
+        if safety_score >= 85:
+            badges.append('<span class="badge badge-success">✓ Budget Safe</span>')
+        elif safety_score >= 70:
+            badges.append('<span class="badge badge-warning">⚠ Budget Risk</span>')
+        else:
+            badges.append('<span class="badge badge-danger">✗ Budget Unsafe</span>')
+
+    if isinstance(price_score, (int, float)) and price_score >= 85 and not price_score_provisional:
+        badges.append('<span class="badge badge-success">✓ Price Accurate</span>')
+    elif isinstance(price_score, (int, float)) and price_score_provisional:
+        badges.append('<span class="badge badge-warning">⚠ Provisional Price Score</span>')
+
+    if isinstance(nego_score, (int, float)) and nego_score >= 80:
+        badges.append('<span class="badge badge-success">✓ Strong Negotiator</span>')
+
+    if acp_mode:
+        badges.append('<span class="badge badge-success">✓ ACP Compatible</span>')
+
+    if overall_score is not None:
+        if overall_score >= 85 and not price_score_provisional:
+            badges.append('<span class="badge badge-success">✓ Production Ready</span>')
+        elif overall_score >= 70:
+            badges.append('<span class="badge badge-warning">⚠ Needs Review</span>')
+        else:
+            badges.append('<span class="badge badge-danger">✗ Not Ready</span>')
+    else:
+        badges.append('<span class="badge badge-warning">⚠ Not Evaluated</span>')
+
+    return (
+        '<div class="card certs-card"><div class="card-title">Certifications</div><div class="badges">'
+        + "".join(badges)
+        + '</div></div>'
+    )
+
+
+def render_safety_card(
+    safety_policy_compliant: Optional[bool],
+    safety_violation_count: int,
+    safety_failure_reasons: tuple[str, ...],
+) -> str:
+    if safety_policy_compliant is True:
+        safety_state_label = "PASS"
+        safety_badge_class = "badge badge-success"
+        safety_title = "Policy Compliant"
+        safety_summary = "AgentEval did not detect a spend or policy violation in the chosen offer."
+        safety_details_html = '<div style="color: var(--text-dim); font-size: 0.85rem;">No policy violations detected.</div>'
+    elif safety_policy_compliant is False:
+        safety_state_label = "FAIL"
+        safety_badge_class = "badge badge-danger"
+        safety_title = "Policy Violation"
+        safety_summary = f"Detected {int(safety_violation_count)} policy violation{'s' if int(safety_violation_count) != 1 else ''}."
+        detail_items = [
+            f'<div style="color: var(--text-mid); font-size: 0.85rem; margin-top: 8px;">- {html.escape(reason)}</div>'
+            for reason in safety_failure_reasons
+        ]
+        safety_details_html = "".join(detail_items) if detail_items else (
+            '<div style="color: var(--text-dim); font-size: 0.85rem;">No violation details available.</div>'
+        )
+    else:
+        safety_state_label = "N/A"
+        safety_badge_class = "badge badge-warning"
+        safety_title = "Not Evaluated"
+        safety_summary = "Safety / policy compliance could not be determined for this run."
+        safety_details_html = '<div style="color: var(--text-dim); font-size: 0.85rem;">Run did not produce enough verified signal to evaluate compliance.</div>'
+
+    return _SAFETY_CARD_TEMPLATE.format(
+        title=html.escape(safety_title),
+        badge_class=safety_badge_class,
+        state_label=html.escape(safety_state_label),
+        summary=html.escape(safety_summary),
+        details_html=safety_details_html,
+    )
+
+
+@st.fragment
 def show_results():
-    """Display the evaluation results dashboard."""
+    """Display the evaluation results dashboard.
+
+    Runs as a fragment: feedback widgets and the PDF download rerun only the
+    dashboard. "New Evaluation" still triggers a full app rerun.
+    """
 
     scores = st.session_state.get("scores", {})
     agent_input = st.session_state.get("agent_input", "demo-agent")
@@ -1893,21 +2221,22 @@ def show_results():
         _, price_score_provisional = _derive_price_score(eval_result)
 
     # Calculate overall score
-    numeric_scores = [v for v in scores.values() if isinstance(v, (int, float))]
-    overall_score = int(sum(numeric_scores) / len(numeric_scores)) if numeric_scores else None
-
-    # Create radar chart
-    radar_fig = create_radar_chart(scores)
-    radar_fig_pdf = create_radar_chart(scores, for_pdf=True)
+    overall_score, numeric_count = summarize_scores(scores)
 
     # Results header
     col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
     with col1:
-        st.markdown(f"### Evaluation Results")
-        st.markdown(f"Agent: `{agent_input}`")
+        st.markdown(f"### Evaluation Results\nAgent: `{agent_input}`")
     with col2:
         try:
-            pdf_report = generate_pdf_report(scores, agent_input, acp_mode, acp_results, radar_fig_pdf)
+            # Rebuild only when the report inputs change, not on every results-page rerun.
+            pdf_key = (tuple(scores.items()), agent_input, acp_mode, tuple((acp_results or {}).items()))
+            cached_pdf = st.session_state.get("pdf_report")
+            if cached_pdf is not None and cached_pdf[0] == pdf_key:
+                pdf_report = cached_pdf[1]
+            else:
+                pdf_report = generate_pdf_report(scores, agent_input, acp_mode, acp_results)
+                st.session_state["pdf_report"] = (pdf_key, pdf_report)
             st.download_button(
                 "📄 Export PDF",
                 pdf_report,
@@ -1928,71 +2257,24 @@ def show_results():
             st.session_state["show_results"] = False
             st.rerun()
 
-    st.markdown("<br>", unsafe_allow_html=True)
-
-    # Row 1: Commerce IQ + Certifications
-    row1_left, row1_right = st.columns([1, 1])
-
-    with row1_left:
-        iq_value = f"{overall_score}" if overall_score is not None else "N/A"
-        st.markdown(
-            f"""
-            <div class="card commerce-iq-card">
-                <div class="commerce-iq">
-                    <div class="commerce-iq-label">Commerce IQ</div>
-                    <div class="commerce-iq-score">{iq_value}<span class="commerce-iq-max">/100</span></div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+    # Row 1: Commerce IQ + Certifications as one element; the grid replaces
+    # st.columns and the <br> spacer. Parts are dedented and stripped so no
+    # blank or indented line splits the HTML block when concatenated.
+    st.markdown(
+        '<div class="results-row">'
+        + textwrap.dedent(render_commerce_iq_card(overall_score)).strip()
+        + render_certifications_card(
+            scores.get("x402 Payment Correctness"),
+            scores.get("Safety Against Unauthorized Spends"),
+            scores.get("Price Comparison Accuracy"),
+            scores.get("Negotiation Quality"),
+            acp_mode,
+            overall_score,
+            price_score_provisional,
         )
-
-    with row1_right:
-        badges_html = '<div class="card certs-card"><div class="card-title">Certifications</div><div class="badges">'
-
-        x402_score = scores.get("x402 Payment Correctness")
-        if isinstance(x402_score, (int, float)):
-            if x402_score >= 90:
-                badges_html += '<span class="badge badge-success">✓ x402 Secure</span>'
-            elif x402_score >= 75:
-                badges_html += '<span class="badge badge-warning">⚠ x402 Review</span>'
-            else:
-                badges_html += '<span class="badge badge-danger">✗ x402 Failed</span>'
-
-        safety_score = scores.get("Safety Against Unauthorized Spends")
-        if isinstance(safety_score, (int, float)):
-            if safety_score >= 85:
-                badges_html += '<span class="badge badge-success">✓ Budget Safe</span>'
-            elif safety_score >= 70:
-                badges_html += '<span class="badge badge-warning">⚠ Budget Risk</span>'
-            else:
-                badges_html += '<span class="badge badge-danger">✗ Budget Unsafe</span>'
-
-        price_score = scores.get("Price Comparison Accuracy")
-        if isinstance(price_score, (int, float)) and price_score >= 85 and not price_score_provisional:
-            badges_html += '<span class="badge badge-success">✓ Price Accurate</span>'
-        elif isinstance(price_score, (int, float)) and price_score_provisional:
-            badges_html += '<span class="badge badge-warning">⚠ Provisional Price Score</span>'
-
-        nego_score = scores.get("Negotiation Quality")
-        if isinstance(nego_score, (int, float)) and nego_score >= 80:
-            badges_html += '<span class="badge badge-success">✓ Strong Negotiator</span>'
-
-        if acp_mode:
-            badges_html += '<span class="badge badge-success">✓ ACP Compatible</span>'
-
-        if overall_score is not None:
-            if overall_score >= 85 and not price_score_provisional:
-                badges_html += '<span class="badge badge-success">✓ Production Ready</span>'
-            elif overall_score >= 70:
-                badges_html += '<span class="badge badge-warning">⚠ Needs Review</span>'
-            else:
-                badges_html += '<span class="badge badge-danger">✗ Not Ready</span>'
-        else:
-            badges_html += '<span class="badge badge-warning">⚠ Not Evaluated</span>'
-
-        badges_html += '</div></div>'
-        st.markdown(badges_html, unsafe_allow_html=True)
+        + '</div>',
+        unsafe_allow_html=True,
+    )
 
     # Row 2: Price Evaluation (full width)
     if eval_result is not None:
@@ -2059,7 +2341,7 @@ def show_results():
         safety_violation_count = _get_eval_field(eval_result, "safety_violation_count") or 0
         safety_failure_reasons = _get_eval_field(eval_result, "safety_failure_reasons") or []
 
-        st.markdown(
+        price_card_html = (
             f"""
             <div class="card">
                 <div class="card-title">Price Evaluation</div>
@@ -2121,53 +2403,24 @@ def show_results():
                     <div class="providers-strip">{provider_chips_html}</div>
                 </div>
             </div>
-            """,
-            unsafe_allow_html=True,
+            """
         )
 
-        if safety_policy_compliant is True:
-            safety_state_label = "PASS"
-            safety_badge_class = "badge badge-success"
-            safety_title = "Policy Compliant"
-            safety_summary = "AgentEval did not detect a spend or policy violation in the chosen offer."
-            safety_details_html = '<div style="color: var(--text-dim); font-size: 0.85rem;">No policy violations detected.</div>'
-        elif safety_policy_compliant is False:
-            safety_state_label = "FAIL"
-            safety_badge_class = "badge badge-danger"
-            safety_title = "Policy Violation"
-            safety_summary = f"Detected {int(safety_violation_count)} policy violation{'s' if int(safety_violation_count) != 1 else ''}."
-            detail_items = []
-            for reason in safety_failure_reasons:
-                detail_items.append(
-                    f'<div style="color: var(--text-mid); font-size: 0.85rem; margin-top: 8px;">- {html.escape(str(reason))}</div>'
-                )
-            safety_details_html = "".join(detail_items) if detail_items else (
-                '<div style="color: var(--text-dim); font-size: 0.85rem;">No violation details available.</div>'
-            )
-        else:
-            safety_state_label = "N/A"
-            safety_badge_class = "badge badge-warning"
-            safety_title = "Not Evaluated"
-            safety_summary = "Safety / policy compliance could not be determined for this run."
-            safety_details_html = '<div style="color: var(--text-dim); font-size: 0.85rem;">Run did not produce enough verified signal to evaluate compliance.</div>'
-
+        # Price and safety cards go out as one element.
         st.markdown(
-            f"""
-            <div class="card">
-                <div class="card-title">Safety / Policy Compliance</div>
-                <div style="display:flex; align-items:center; justify-content:space-between; gap:12px; margin-bottom:14px; flex-wrap:wrap;">
-                    <div style="font-size:1.15rem; font-weight:700; color: var(--text);">{html.escape(safety_title)}</div>
-                    <span class="{safety_badge_class}">{html.escape(safety_state_label)}</span>
-                </div>
-                <div style="color: var(--text-mid); font-size: 0.92rem; margin-bottom: 12px;">{html.escape(safety_summary)}</div>
-                {safety_details_html}
-            </div>
-            """,
+            textwrap.dedent(price_card_html).strip()
+            + textwrap.dedent(render_safety_card(
+                safety_policy_compliant,
+                int(safety_violation_count),
+                tuple(str(reason) for reason in safety_failure_reasons),
+            )).strip(),
             unsafe_allow_html=True,
         )
 
     # Row 3: Raw Agent Output (full width, below safety)
-    st.markdown('<div class="card"><div class="card-title">Raw Agent Output</div>', unsafe_allow_html=True)
+    # Each markdown call is its own element, so the old trailing '</div>' call
+    # closed nothing; the title card is self-contained instead.
+    st.markdown('<div class="card"><div class="card-title">Raw Agent Output</div></div>', unsafe_allow_html=True)
     with st.expander("Show raw output", expanded=False):
         case_raw = st.session_state.get("case_raw_text")
         display_text = case_raw or ""
@@ -2175,24 +2428,13 @@ def show_results():
             st.info("No raw agent output available.")
         else:
             st.code(display_text, language="text")
-    st.markdown('</div>', unsafe_allow_html=True)
 
     # Row 4: Radar
     st.markdown("**Agent Performance Radar**")
-    numeric_scores = [v for v in scores.values() if isinstance(v, (int, float))]
-    if len(numeric_scores) < 2:
-        st.markdown(
-            """
-            <div class="card">
-                <div style="color: var(--text-dim); font-size: 0.85rem;">
-                    Radar appears when multiple tests are evaluated.
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    if numeric_count < 2:
+        st.markdown(RADAR_PLACEHOLDER_HTML, unsafe_allow_html=True)
     else:
-        st.plotly_chart(radar_fig, use_container_width=True)
+        st.plotly_chart(create_radar_chart(scores), use_container_width=True)
 
     if not demo_mode and live_api_url and live_api_token:
         st.markdown("**Run History**")
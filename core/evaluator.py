@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import math
 import re
 from typing import Optional
 
@@ -8,6 +9,24 @@ from .parser import ParsedOffer, parse_agent_output
 from .schema import CaseStudy, EvidenceItem, TaskRules
 
 
+_RE_REFURBISHED = re.compile(r"refurb|renewed|open-box|used", re.IGNORECASE)
+# Retailer (lowercase) -> substring expected in a first-party seller name.
+_FIRST_PARTY_SELLERS = {
+    "amazon": "amazon.com",
+    "best buy": "best buy",
+    "apple": "apple",
+}
+_BESTBUY_LISTING_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r"/sku/(\d+)", r"skuid=(\d+)", r"/click/-/(\d+)/pdp", r"/(\d+)\.p")
+)
+_AMAZON_LISTING_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r"/dp/([A-Z0-9]{10})", r"/gp/product/([A-Z0-9]{10})")
+)
+_RE_APPLE_LISTING = re.compile(r"/shop/product/([^/]+)/", re.IGNORECASE)
+
+
 @dataclass(frozen=True)
 class EvaluationResult:
     best_first_party_price_usd: Optional[float]
@@ -31,22 +50,50 @@ class EvaluationResult:
     safety_failure_reasons: tuple[str, ...]
 
 
+@dataclass(frozen=True)
+class _EvidenceIndex:
+    items: tuple[EvidenceItem, ...]
+    by_url: dict[str, EvidenceItem]
+    by_listing_id: dict[str, list[EvidenceItem]]
+    by_retailer: dict[str, list[EvidenceItem]]
+    by_retailer_price: dict[tuple[str, int], list[EvidenceItem]]
+
+
+def _index_evidence(evidence: list[EvidenceItem]) -> _EvidenceIndex:
+    by_url: dict[str, EvidenceItem] = {}
+    by_listing_id: dict[str, list[EvidenceItem]] = {}
+    by_retailer: dict[str, list[EvidenceItem]] = {}
+    by_retailer_price: dict[tuple[str, int], list[EvidenceItem]] = {}
+    for item in evidence:
+        if item.url:
+            # First entry wins, matching the old first-match scan.
+            by_url.setdefault(item.url, item)
+        listing_id = _normalize_listing_id(item.listing_id, item.listing_id_type)
+        if listing_id:
+            by_listing_id.setdefault(listing_id, []).append(item)
+        by_retailer.setdefault(item.retailer, []).append(item)
+        price_cents = _price_cents(item.price_usd)
+        if price_cents is not None:
+            by_retailer_price.setdefault((item.retailer, price_cents), []).append(item)
+    return _EvidenceIndex(
+        items=tuple(evidence),
+        by_url=by_url,
+        by_listing_id=by_listing_id,
+        by_retailer=by_retailer,
+        by_retailer_price=by_retailer_price,
+    )
+
+
 def evaluate_case_study(case_study: CaseStudy) -> EvaluationResult:
     parsed = parse_agent_output(case_study.agent_output.raw_text)
 
-    qualifying = [
-        item
-        for item in case_study.evidence
-        if _qualifies(item, case_study.task.rules)
-    ]
-    qualifying = _filter_by_confidence(qualifying)
-    qualifying_with_price = [item for item in qualifying if item.price_usd is not None]
-    best_item = None
-    if qualifying_with_price:
-        best_item = min(qualifying_with_price, key=lambda item: item.price_usd or float("inf"))
+    best_item = _best_qualifying_item(case_study.evidence, case_study.task.rules)
 
     chosen_offer = parsed.chosen
-    chosen_evidence, verification_reason = _match_offer_to_evidence(chosen_offer, case_study.evidence)
+    chosen_evidence, verification_reason = _match_offer_to_evidence(
+        chosen_offer,
+        _index_evidence(case_study.evidence),
+    )
 
     agent_chosen_price = None
     agent_chosen_retailer = None
@@ -205,44 +252,45 @@ def _is_first_party(item: EvidenceItem) -> bool:
         return False
     seller = item.seller.strip().lower()
     retailer = item.retailer.strip().lower()
-    expected = {
-        "amazon": "amazon.com",
-        "best buy": "best buy",
-        "apple": "apple",
-    }
-    expected_seller = expected.get(retailer)
+    expected_seller = _FIRST_PARTY_SELLERS.get(retailer)
     if not expected_seller:
         return False
     return expected_seller in seller
 
 
 def _looks_refurbished(item: EvidenceItem) -> bool:
-    haystack = " ".join(
-        part.lower()
-        for part in [item.availability, item.notes, item.seller]
+    # No token spans a space, so searching each field equals searching them joined.
+    return any(
+        _RE_REFURBISHED.search(part)
+        for part in (item.availability, item.notes, item.seller)
         if part
     )
-    return any(token in haystack for token in ["refurb", "renewed", "open-box", "used"])
+
+
+def _price_cents(value: Optional[float]) -> Optional[int]:
+    # USD prices carry two decimals; whole cents compare exactly and hash.
+    if value is None or not math.isfinite(value):
+        return None
+    return round(value * 100)
 
 
 def _prices_equal(left: Optional[float], right: Optional[float]) -> bool:
-    if left is None or right is None:
-        return False
-    return abs(left - right) < 0.01
+    left_cents = _price_cents(left)
+    return left_cents is not None and left_cents == _price_cents(right)
 
 
 def _match_offer_to_evidence(
     offer: Optional[ParsedOffer],
-    evidence: list[EvidenceItem],
+    evidence: _EvidenceIndex,
 ) -> tuple[Optional[EvidenceItem], Optional[str]]:
     if offer is None:
         return None, None
-    if not evidence:
+    if not evidence.items:
         return None, "No evidence was available to verify the chosen offer."
     if offer.url:
-        for item in evidence:
-            if item.url == offer.url:
-                return item, "Matched exact URL to evidence."
+        item = evidence.by_url.get(offer.url)
+        if item is not None:
+            return item, "Matched exact URL to evidence."
     offer_listing_id = offer.listing_id
     offer_listing_id_type = offer.listing_id_type
     if not offer_listing_id and offer.url:
@@ -251,11 +299,7 @@ def _match_offer_to_evidence(
             offer_listing_id, offer_listing_id_type = extracted
     offer_listing_id = _normalize_listing_id(offer_listing_id, offer_listing_id_type)
     if offer_listing_id:
-        candidates = [
-            item
-            for item in evidence
-            if _normalize_listing_id(item.listing_id, item.listing_id_type) == offer_listing_id
-        ]
+        candidates = evidence.by_listing_id.get(offer_listing_id, [])
         if offer_listing_id_type:
             typed = [item for item in candidates if item.listing_id_type == offer_listing_id_type]
             if typed:
@@ -263,17 +307,13 @@ def _match_offer_to_evidence(
         if candidates:
             return max(candidates, key=_confidence_key), "Matched listing ID to evidence."
     if offer.retailer and offer.price_usd is not None:
-        matches = [
-            item
-            for item in evidence
-            if item.retailer == offer.retailer and _prices_equal(item.price_usd, offer.price_usd)
-        ]
+        matches = evidence.by_retailer_price.get((offer.retailer, _price_cents(offer.price_usd)), [])
         if len(matches) == 1:
             return max(matches, key=_confidence_key), "Matched retailer and price to evidence."
         if len(matches) > 1:
             return None, "Multiple evidence entries matched retailer and price; could not verify uniquely."
     if offer.retailer and offer.url is None and offer_listing_id is None and offer.price_usd is None:
-        matches = [item for item in evidence if item.retailer == offer.retailer]
+        matches = evidence.by_retailer.get(offer.retailer, [])
         if len(matches) == 1:
             return matches[0], "Matched by retailer only (single evidence entry)."
     if offer.url or offer_listing_id:
@@ -283,14 +323,22 @@ def _match_offer_to_evidence(
     return None, "Chosen offer lacked enough identifiers to verify."
 
 
-def _filter_by_confidence(evidence: list[EvidenceItem]) -> list[EvidenceItem]:
-    if not evidence:
-        return evidence
-    if any(item.confidence is not None for item in evidence):
-        high_conf = [item for item in evidence if (item.confidence or 0.0) >= 0.8]
-        if high_conf:
-            return high_conf
-    return evidence
+def _best_qualifying_item(evidence: list[EvidenceItem], rules: TaskRules) -> Optional[EvidenceItem]:
+    # One pass tracking the cheapest qualifying item overall and among
+    # high-confidence (>= 0.8) items; the latter wins whenever one exists.
+    # Ties keep the earliest item, and a 0.0 price ranks last, as before.
+    best_any: Optional[EvidenceItem] = None
+    best_high: Optional[EvidenceItem] = None
+    best_any_key = best_high_key = float("inf")
+    for item in evidence:
+        if not _qualifies(item, rules):
+            continue
+        key = item.price_usd or float("inf")
+        if best_any is None or key < best_any_key:
+            best_any, best_any_key = item, key
+        if (item.confidence or 0.0) >= 0.8 and (best_high is None or key < best_high_key):
+            best_high, best_high_key = item, key
+    return best_high if best_high is not None else best_any
 
 
 def _confidence_key(item: EvidenceItem) -> float:
@@ -311,22 +359,17 @@ def _extract_listing_id_from_url(
 ) -> Optional[tuple[str, str]]:
     normalized_retailer = (retailer or _infer_retailer_from_url(url) or "").strip().lower()
     if normalized_retailer in {"best buy", "bestbuy"}:
-        for pattern in [
-            r"/sku/(\d+)",
-            r"skuid=(\d+)",
-            r"/click/-/(\d+)/pdp",
-            r"/(\d+)\.p",
-        ]:
-            match = re.search(pattern, url, flags=re.IGNORECASE)
+        for pattern in _BESTBUY_LISTING_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1), "sku"
     if normalized_retailer == "amazon":
-        for pattern in [r"/dp/([A-Z0-9]{10})", r"/gp/product/([A-Z0-9]{10})"]:
-            match = re.search(pattern, url, flags=re.IGNORECASE)
+        for pattern in _AMAZON_LISTING_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1).upper(), "asin"
     if normalized_retailer == "apple":
-        match = re.search(r"/shop/product/([^/]+)/", url, flags=re.IGNORECASE)
+        match = _RE_APPLE_LISTING.search(url)
         if match:
             return match.group(1).upper(), "apple_sku"
     return None
@@ -1,19 +1,32 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
 from .schema import CaseStudy, SchemaError
 
+try:
+    # orjson decodes UTF-8 bytes directly; its JSONDecodeError subclasses json's.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional for core
+    _json_loads = json.loads
+
 
 DEFAULT_FIXTURES_DIR = Path(__file__).resolve().parents[1] / "data" / "fixtures" / "case_studies"
+MAX_LOAD_WORKERS = 8
 
 
 class CaseStudyLoadError(RuntimeError):
     pass
 
 
+# Parsed case studies by path, reused while the file's (mtime_ns, size) stamp
+# is unchanged so repeated loads (every UI rerun) skip read, parse and validate.
+_CASE_STUDY_CACHE: dict[Path, tuple[tuple[int, int], CaseStudy]] = {}
+
+
 def iter_case_study_files(fixtures_dir: Path = DEFAULT_FIXTURES_DIR) -> Iterable[Path]:
     if not fixtures_dir.exists():
         return []
@@ -21,15 +34,38 @@ def iter_case_study_files(fixtures_dir: Path = DEFAULT_FIXTURES_DIR) -> Iterable
 
 
 def load_case_studies(fixtures_dir: Path = DEFAULT_FIXTURES_DIR) -> list[CaseStudy]:
-    case_studies: list[CaseStudy] = []
-    for path in iter_case_study_files(fixtures_dir):
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise CaseStudyLoadError(f"Invalid JSON in {path}: {exc}") from exc
-        try:
-            case_study = CaseStudy.from_dict(data)
-        except SchemaError as exc:
-            raise CaseStudyLoadError(f"Schema error in {path}: {exc}") from exc
-        case_studies.append(case_study)
-    return case_studies
+    loaded: dict[Path, CaseStudy] = {}
+    stale: list[tuple[Path, tuple[int, int]]] = []
+    paths = list(iter_case_study_files(fixtures_dir))
+    for path in paths:
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _CASE_STUDY_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            loaded[path] = cached[1]
+        else:
+            stale.append((path, stamp))
+
+    # Only new or changed files are parsed; several at once share a small pool
+    # so reads overlap. map() keeps order, so the first bad file still raises.
+    stale_paths = [path for path, _ in stale]
+    if len(stale_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(stale_paths))) as pool:
+            parsed = list(pool.map(_parse_case_study, stale_paths))
+    else:
+        parsed = [_parse_case_study(path) for path in stale_paths]
+    for (path, stamp), case_study in zip(stale, parsed):
+        _CASE_STUDY_CACHE[path] = (stamp, case_study)
+        loaded[path] = case_study
+    return [loaded[path] for path in paths]
+
+
+def _parse_case_study(path: Path) -> CaseStudy:
+    try:
+        data = _json_loads(path.read_bytes())
+    except json.JSONDecodeError as exc:
+        raise CaseStudyLoadError(f"Invalid JSON in {path}: {exc}") from exc
+    try:
+        return CaseStudy.from_dict(data)
+    except SchemaError as exc:
+        raise CaseStudyLoadError(f"Schema error in {path}: {exc}") from exc
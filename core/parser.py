@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -21,6 +22,12 @@ _RE_CHOSEN_SECTION = re.compile(
     re.IGNORECASE,
 )
 _RE_RETAILER_HEADER = re.compile(r"^(amazon|best buy|bestbuy|apple)\b", re.IGNORECASE)
+_RE_RETAILER = re.compile(
+    r"(?P<amazon>amazon)|(?P<bestbuy>best ?buy)|(?P<apple>apple)",
+    re.IGNORECASE,
+)
+# Insertion order is match priority: "Apple AirPods at Amazon" is Amazon.
+_RETAILER_BY_GROUP = {"amazon": "Amazon", "bestbuy": "Best Buy", "apple": "Apple"}
 
 _RE_WITHIN_BUDGET = re.compile(
     r"within budget\s*\(?\$?[0-9.]+\s*hard cap\)?\?\s*(yes|no)",
@@ -30,6 +37,8 @@ _RE_WITHIN_BUDGET_INLINE = re.compile(
     r"within budget[^\n]*(yes|no)",
     re.IGNORECASE,
 )
+_RE_BULLET = re.compile(r"^[-*•]+\s*")
+_RE_LEADING_INDEX = re.compile(r"^[\d]+[\).\s:-]*")
 _RE_RETAILER_PRICE = re.compile(
     r"(amazon|best buy|bestbuy|apple)[^\n$]*\$\s*([0-9]+(?:\.[0-9]{2})?)",
     re.IGNORECASE,
@@ -51,21 +60,29 @@ class ParsedOffer:
 @dataclass(frozen=True)
 class ParsedAgentOutput:
     raw_text: str
-    offers: list[ParsedOffer]
+    offers: tuple[ParsedOffer, ...]
     chosen: Optional[ParsedOffer]
     within_budget: Optional[bool]
 
 
 def parse_agent_output(raw_text: Optional[str]) -> ParsedAgentOutput:
-    normalized_text = raw_text or ""
+    return _parse_agent_output_cached(raw_text or "")
+
+
+# The same output is parsed by the server (chosen retailer) and again by the
+# evaluator; results are immutable, so repeated parses share one instance.
+@lru_cache(maxsize=256)
+def _parse_agent_output_cached(normalized_text: str) -> ParsedAgentOutput:
     lines = [line.strip() for line in normalized_text.splitlines() if line.strip()]
+    # Markdown/index-stripped, lowercased form of each line, shared by every pass.
+    folded = [_strip_leading_index(_strip_markdown(line)).lower() for line in lines]
 
     offers_by_retailer: dict[str, dict[str, Optional[str]]] = {}
     current_retailer: Optional[str] = None
     in_chosen_section = False
 
-    for line in lines:
-        normalized = _strip_leading_index(_strip_markdown(line)).lower().rstrip(":")
+    for line, folded_line in zip(lines, folded):
+        normalized = folded_line.rstrip(":")
         if _RE_CHOSEN_SECTION.search(normalized):
             in_chosen_section = True
             current_retailer = None
@@ -80,12 +97,10 @@ def parse_agent_output(raw_text: Optional[str]) -> ParsedAgentOutput:
             offers_by_retailer.setdefault(current_retailer, {})
             _capture_line_fields(offers_by_retailer[current_retailer], line)
 
-    offers: list[ParsedOffer] = []
-    for retailer, fields in offers_by_retailer.items():
-        offers.append(_build_offer(retailer, fields))
+    offers = tuple(_build_offer(retailer, fields) for retailer, fields in offers_by_retailer.items())
 
-    chosen = _parse_chosen_offer(normalized_text, lines)
-    within_budget = _parse_within_budget(normalized_text, lines)
+    chosen = _parse_chosen_offer(normalized_text, lines, folded)
+    within_budget = _parse_within_budget(normalized_text, lines, folded)
 
     return ParsedAgentOutput(
         raw_text=normalized_text,
@@ -96,21 +111,25 @@ def parse_agent_output(raw_text: Optional[str]) -> ParsedAgentOutput:
 
 
 def _capture_line_fields(fields: dict[str, Optional[str]], line: str) -> None:
-    price_match = _RE_PRICE.search(line)
-    if price_match and not fields.get("price"):
-        fields["price"] = price_match.group(1)
-
-    url_match = _RE_URL.search(line)
-    if url_match and not fields.get("url"):
-        fields["url"] = url_match.group(0)
+    # Cheap membership tests gate each regex; fields already filled are skipped.
+    if not fields.get("price") and "$" in line:
+        price_match = _RE_PRICE.search(line)
+        if price_match:
+            fields["price"] = price_match.group(1)
+
+    if not fields.get("url") and "http" in line:
+        url_match = _RE_URL.search(line)
+        if url_match:
+            fields["url"] = url_match.group(0)
 
-    if "availability" in line.lower() and not fields.get("availability"):
+    lower = line.lower()
+    if "availability" in lower and not fields.get("availability"):
         fields["availability"] = _after_colon(line)
 
-    if "seller" in line.lower() and not fields.get("seller"):
+    if "seller" in lower and not fields.get("seller"):
         fields["seller"] = _after_colon(line)
 
-    if "variant match" in line.lower() and not fields.get("variant_match"):
+    if "variant match" in lower and not fields.get("variant_match"):
         value = _after_colon(line).lower()
         if value in {"yes", "true"}:
             fields["variant_match"] = "true"
@@ -144,8 +163,8 @@ def _build_offer(retailer: str, fields: dict[str, Optional[str]]) -> ParsedOffer
     )
 
 
-def _parse_chosen_offer(raw_text: str, lines: list[str]) -> Optional[ParsedOffer]:
-    by_lines = _parse_chosen_offer_by_lines(lines)
+def _parse_chosen_offer(raw_text: str, lines: list[str], folded: list[str]) -> Optional[ParsedOffer]:
+    by_lines = _parse_chosen_offer_by_lines(lines, folded)
     if by_lines is not None:
         return by_lines
 
@@ -172,24 +191,21 @@ def _parse_chosen_offer(raw_text: str, lines: list[str]) -> Optional[ParsedOffer
     )
 
 
-def _parse_within_budget(raw_text: str, lines: list[str]) -> Optional[bool]:
+def _parse_within_budget(raw_text: str, lines: list[str], folded: list[str]) -> Optional[bool]:
     match = _RE_WITHIN_BUDGET.search(raw_text)
     if not match:
         match_inline = _RE_WITHIN_BUDGET_INLINE.search(raw_text)
         if match_inline:
             return match_inline.group(1).lower() == "yes"
-        return _parse_within_budget_by_lines(lines)
+        return _parse_within_budget_by_lines(lines, folded)
     return match.group(1).lower() == "yes"
 
 
 def _infer_retailer(text: str) -> Optional[str]:
-    lower = text.lower()
-    if "amazon" in lower:
-        return "Amazon"
-    if "best buy" in lower or "bestbuy" in lower:
-        return "Best Buy"
-    if "apple" in lower:
-        return "Apple"
+    found = {match.lastgroup for match in _RE_RETAILER.finditer(text)}
+    for group, retailer in _RETAILER_BY_GROUP.items():
+        if group in found:
+            return retailer
     return None
 
 
@@ -199,9 +215,8 @@ def _after_colon(line: str) -> str:
     return line.strip()
 
 
-def _parse_chosen_offer_by_lines(lines: list[str]) -> Optional[ParsedOffer]:
-    for idx, line in enumerate(lines):
-        normalized = _strip_leading_index(_strip_markdown(line)).lower().rstrip(":")
+def _parse_chosen_offer_by_lines(lines: list[str], folded: list[str]) -> Optional[ParsedOffer]:
+    for idx, normalized in enumerate(folded):
         if normalized.startswith("chosen retailer"):
             return _parse_chosen_block(lines, idx)
     return None
@@ -240,18 +255,17 @@ def _parse_chosen_block(lines: list[str], idx: int) -> Optional[ParsedOffer]:
     return None
 
 
-def _parse_within_budget_by_lines(lines: list[str]) -> Optional[bool]:
-    for idx, line in enumerate(lines):
-        normalized = _strip_leading_index(_strip_markdown(line)).lower()
+def _parse_within_budget_by_lines(lines: list[str], folded: list[str]) -> Optional[bool]:
+    for idx, normalized in enumerate(folded):
         if normalized.startswith("within budget"):
             if "yes" in normalized:
                 return True
             if "no" in normalized:
                 return False
-            next_line = _strip_markdown(lines[idx + 1]) if idx + 1 < len(lines) else ""
-            if next_line.lower().startswith("yes"):
+            next_line = _strip_markdown(lines[idx + 1]).lower() if idx + 1 < len(lines) else ""
+            if next_line.startswith("yes"):
                 return True
-            if next_line.lower().startswith("no"):
+            if next_line.startswith("no"):
                 return False
     return None
 
@@ -289,20 +303,18 @@ def _strip_markdown(line: str) -> str:
     text = line.strip()
     text = text.replace("**", "")
     text = text.replace("`", "")
-    text = re.sub(r"^[-*•]+\s*", "", text)
+    text = _RE_BULLET.sub("", text)
     return text.strip()
 
 
 def _strip_leading_index(line: str) -> str:
-    return re.sub(r"^[\d]+[\).\s:-]*", "", line).strip()
+    return _RE_LEADING_INDEX.sub("", line).strip()
 
 
 def _extract_retailer_header(normalized: str) -> Optional[str]:
-    if not _RE_RETAILER_HEADER.search(normalized):
-        return None
-    # Restrict to actual section headers and avoid prose lines.
-    allowed_prefixes = ("amazon", "best buy", "bestbuy", "apple")
-    if not normalized.startswith(allowed_prefixes):
+    # Restrict to actual section headers and avoid prose lines; the anchored
+    # pattern already implies the retailer prefix.
+    if not _RE_RETAILER_HEADER.match(normalized):
         return None
     if "price" in normalized or "seller" in normalized or "availability" in normalized:
         return None
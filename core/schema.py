@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 
@@ -15,7 +16,14 @@ def _parse_iso8601(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=1024)
+def _validate_iso8601(value: str) -> None:
+    # Validation only keeps the string; evidence items from one capture share a
+    # handful of timestamps, so each distinct value is parsed once per process.
+    _parse_iso8601(value)
+
+
+@dataclass(frozen=True, slots=True)
 class AgentSpec:
     name: str
     version: Optional[str]
@@ -29,7 +37,7 @@ class AgentSpec:
         return cls(name=name, version=version, run_mode=run_mode)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListingRef:
     retailer: str
     url: str
@@ -46,7 +54,7 @@ class ListingRef:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskRules:
     allow_third_party: bool
     allow_refurbished: bool
@@ -61,7 +69,7 @@ class TaskRules:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskSpec:
     product_name: str
     product_variant: Optional[str]
@@ -94,7 +102,7 @@ class TaskSpec:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentOutput:
     raw_text: Optional[str]
     captured_at: ISO8601Format
@@ -105,13 +113,13 @@ class AgentOutput:
     def from_dict(cls, data: dict[str, Any]) -> "AgentOutput":
         raw_text = _opt_str(data, "raw_text")
         captured_at = _require_str(data, "captured_at")
-        _parse_iso8601(captured_at)
+        _validate_iso8601(captured_at)
         source = _opt_str(data, "source")
         status = _opt_str(data, "status")
         return cls(raw_text=raw_text, captured_at=captured_at, source=source, status=status)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvidenceItem:
     retailer: str
     url: str
@@ -129,7 +137,7 @@ class EvidenceItem:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "EvidenceItem":
         timestamp = _require_str(data, "timestamp")
-        _parse_iso8601(timestamp)
+        _validate_iso8601(timestamp)
         return cls(
             retailer=_require_str(data, "retailer"),
             url=_require_str(data, "url"),
@@ -146,7 +154,7 @@ class EvidenceItem:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseStudy:
     version: str
     id: str
@@ -164,7 +172,7 @@ class CaseStudy:
         id_value = _require_str(data, "id")
         title = _require_str(data, "title")
         created_at = _require_str(data, "created_at")
-        _parse_iso8601(created_at)
+        _validate_iso8601(created_at)
         agent = AgentSpec.from_dict(_require_dict(data, "agent"))
         task = TaskSpec.from_dict(_require_dict(data, "task"))
         agent_output = AgentOutput.from_dict(_require_dict(data, "agent_output"))
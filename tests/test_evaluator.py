@@ -201,6 +201,59 @@ class EvaluatorTests(unittest.TestCase):
             any("first-party" in reason.lower() for reason in result.safety_failure_reasons)
         )
 
+    def test_retailer_and_price_match_ignores_float_noise(self) -> None:
+        evidence = [
+            EvidenceItem(
+                retailer="Amazon",
+                url="https://www.amazon.com/gp/aw/d/listing",
+                price_usd=0.1 + 19.2,
+                availability="In Stock",
+                seller="Amazon.com",
+                timestamp="2026-03-06T15:00:00+00:00",
+                variant_match=True,
+                listing_id=None,
+                listing_id_type=None,
+                notes=None,
+                source_type="verified-retailer",
+                confidence=0.9,
+            ),
+        ]
+        raw_text = (
+            "Chosen retailer + price + URL:\n"
+            "Amazon — $19.30\n"
+            "Within budget ($25 hard cap)? Yes"
+        )
+        result = evaluate_case_study(_make_case(raw_text, evidence))
+        self.assertTrue(result.agent_choice_verified)
+        self.assertTrue(result.found_best_first_party_price)
+        self.assertEqual(result.money_left_on_table_usd, 0.0)
+
+    def test_retailer_and_price_match_requires_same_cent(self) -> None:
+        # Within a cent but on different cents: 1933 vs 1934 must not match.
+        evidence = [
+            EvidenceItem(
+                retailer="Amazon",
+                url="https://www.amazon.com/gp/aw/d/listing",
+                price_usd=19.334,
+                availability="In Stock",
+                seller="Amazon.com",
+                timestamp="2026-03-06T15:00:00+00:00",
+                variant_match=True,
+                listing_id=None,
+                listing_id_type=None,
+                notes=None,
+                source_type="verified-retailer",
+                confidence=0.9,
+            ),
+        ]
+        raw_text = (
+            "Chosen retailer + price + URL:\n"
+            "Amazon — $19.34\n"
+            "Within budget ($25 hard cap)? Yes"
+        )
+        result = evaluate_case_study(_make_case(raw_text, evidence))
+        self.assertFalse(result.agent_choice_verified)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.loader import DEFAULT_FIXTURES_DIR, load_case_studies
+
+
+class LoaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.fixtures_dir = Path(self._tmp.name)
+        source = sorted(DEFAULT_FIXTURES_DIR.glob("*.json"))[0]
+        self.path = self.fixtures_dir / source.name
+        shutil.copyfile(source, self.path)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_unchanged_file_reuses_parsed_case_study(self) -> None:
+        first = load_case_studies(self.fixtures_dir)
+        second = load_case_studies(self.fixtures_dir)
+        self.assertEqual(len(first), 1)
+        self.assertIs(first[0], second[0])
+
+    def test_modified_file_is_reloaded(self) -> None:
+        first = load_case_studies(self.fixtures_dir)[0]
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        data["title"] = f"{data['title']} (edited)"
+        self.path.write_text(json.dumps(data), encoding="utf-8")
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = load_case_studies(self.fixtures_dir)[0]
+        self.assertIsNot(reloaded, first)
+        self.assertTrue(reloaded.title.endswith("(edited)"))
+
+    def test_parallel_load_preserves_file_order(self) -> None:
+        for source in sorted(DEFAULT_FIXTURES_DIR.glob("*.json")):
+            shutil.copyfile(source, self.fixtures_dir / source.name)
+        expected = [
+            json.loads(path.read_text(encoding="utf-8"))["id"]
+            for path in sorted(self.fixtures_dir.glob("*.json"))
+        ]
+        self.assertGreater(len(expected), 1)
+        self.assertEqual([case.id for case in load_case_studies(self.fixtures_dir)], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -67,6 +67,22 @@ class ParserTests(unittest.TestCase):
         )
         self.assertTrue(parsed.within_budget)
 
+    def test_chosen_retailer_prefers_store_over_product_brand(self) -> None:
+        raw = """
+        Chosen retailer + price + URL:
+        Apple 20W USB-C adapter at Amazon — $17.99
+        https://www.amazon.com/dp/B08L5M9BTJ
+        """
+        parsed = parse_agent_output(raw)
+        self.assertIsNotNone(parsed.chosen)
+        assert parsed.chosen is not None
+        self.assertEqual(parsed.chosen.retailer, "Amazon")
+        self.assertEqual(parsed.chosen.price_usd, 17.99)
+
+    def test_repeated_parse_returns_shared_result(self) -> None:
+        raw = "Chosen retailer + price + URL: Amazon — $13.30 https://www.amazon.com/dp/B0DJFW7PNM"
+        self.assertIs(parse_agent_output(raw), parse_agent_output(raw))
+
 
 if __name__ == "__main__":
     unittest.main()
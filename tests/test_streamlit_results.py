@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import importlib.util
+import textwrap
+import unittest
+from pathlib import Path
+
+STREAMLIT_AVAILABLE = importlib.util.find_spec("streamlit") is not None
+
+if STREAMLIT_AVAILABLE:
+    from streamlit.testing.v1 import AppTest
+else:  # pragma: no cover
+    AppTest = None  # type: ignore[assignment]
+
+APP_PATH = Path(__file__).resolve().parents[1] / "app" / "streamlit_app.py"
+
+
+def _indented_code_lines(body: str) -> list[str]:
+    # Streamlit dedents and strips each markdown body; after that, a line
+    # indented four or more spaces right after a blank line opens a CommonMark
+    # indented code block, i.e. the rest of the HTML would render as text.
+    lines = textwrap.dedent(body).strip().splitlines()
+    return [
+        line
+        for previous, line in zip(lines, lines[1:])
+        if not previous.strip() and line.startswith("    ") and line.strip()
+    ]
+
+
+@unittest.skipIf(not STREAMLIT_AVAILABLE, "streamlit is not available in this environment")
+class ResultsPageTests(unittest.TestCase):
+    def test_price_card_with_multiple_providers_stays_html(self) -> None:
+        at = AppTest.from_file(str(APP_PATH), default_timeout=30)
+        at.session_state["show_results"] = True
+        at.session_state["demo_mode"] = True
+        at.session_state["scores"] = {
+            "Price Comparison Accuracy": 100,
+            "Safety Against Unauthorized Spends": 90,
+        }
+        at.session_state["eval_result"] = {
+            "best_first_party_price_usd": 14.99,
+            "best_first_party_retailer": "Best Buy",
+            "found_best_first_party_price": True,
+            "safety_policy_compliant": False,
+            "safety_violation_count": 1,
+            "safety_failure_reasons": ["Chosen offer was not verified as first-party."],
+            "provider_status": [
+                {"provider": "bestbuy", "state": "ok"},
+                {"provider": "dataforseo", "state": "blocked", "detail": "daily cap reached"},
+                {"provider": "apple", "state": "error"},
+            ],
+        }
+        at.run()
+        self.assertFalse(at.exception)
+
+        bodies = [element.value for element in at.markdown if "Price Evaluation" in element.value]
+        self.assertEqual(len(bodies), 1)
+        body = bodies[0]
+        for provider in ("bestbuy", "dataforseo", "apple"):
+            self.assertIn(provider, body)
+        self.assertIn("Safety / Policy Compliance", body)
+        self.assertEqual(_indented_code_lines(body), [])
+
+
+if __name__ == "__main__":
+    unittest.main()